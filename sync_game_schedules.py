@@ -1,21 +1,41 @@
 #!/usr/bin/env python3
 import argparse
 import asyncio
+import copy
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
+import operator
 import os
 from pathlib import Path
 import re
-from typing import Any
+import sys
+from typing import Any, Callable, Collection, Coroutine, Iterable
 
+import aiohttp
 from ampapi import AMPControllerInstance, APIParams, Bridge
 from ampapi.modules import ActionResultError
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing when installed.
+    orjson = None
+
+# Expected pattern example: "Some Name -TEMPLATE GROUP-"
+_TEMPLATE_RE = re.compile(r"-\s*template\s+([^-]+?)\s*-", re.IGNORECASE)
+# Accessors used by _v, keyed by (item type, key).
+_ACCESSOR_CACHE: dict[tuple[type, str], Callable[[Any], Any]] = {}
+# Upper bound on concurrent instance detail requests against the controller.
+_INSTANCE_FETCH_CONCURRENCY = 8
+# Everything that is not a letter or digit, used to normalize parameter names.
+_PARAM_KEY_STRIP_RE = re.compile(r"[\W_]+")
+
 class SafeAMPControllerInstance(AMPControllerInstance):
     # ampapi's __del__ may invoke asyncio.run() during interpreter teardown.
     # We explicitly close the session in main(), so this no-op avoids warning noise.
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        super().__init__(session=session)
         self._tracked_instances: list[object] = []
         self._tracked_instance_ids: set[str] = set()
 
@@ -49,12 +69,49 @@ class SafeAMPControllerInstance(AMPControllerInstance):
         await self.__adel__()
 
 
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps_compact(value: Any) -> str:
+    # Stays on the stdlib encoder: these strings are sent back to AMP, and orjson differs from
+    # json.dumps (raw UTF-8 instead of \u escapes, float and NaN formatting).
+    return json.dumps(value, separators=(",", ":"))
+
+
+@dataclass(slots=True)
+class InstanceRow:
+    # Instance list entry with its attributes stringified once for planning loops.
+    instance_id: str
+    instance_name: str
+    module: str
+    friendly_name: str
+    running: bool
+
+
+def _build_instance_rows(instances: Iterable[object]) -> list[InstanceRow]:
+    rows: dict[str, InstanceRow] = {}
+    for instance in instances:
+        instance_id = str(getattr(instance, "instance_id", "") or "")
+        if not instance_id:
+            continue
+        rows[instance_id] = InstanceRow(
+            instance_id=instance_id,
+            instance_name=str(getattr(instance, "instance_name", "")),
+            module=str(getattr(instance, "module", "")),
+            friendly_name=str(getattr(instance, "friendly_name", "")),
+            running=bool(getattr(instance, "running", False)),
+        )
+    return list(rows.values())
+
+
 def _read_config() -> dict[str, str]:
     config_path = Path(__file__).resolve().parent / "amp_config.json"
     if not config_path.exists():
         return {}
-    with config_path.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    data = _json_loads(config_path.read_bytes())
     if not isinstance(data, dict):
         raise RuntimeError("amp_config.json must contain a JSON object")
     return {
@@ -64,6 +121,13 @@ def _read_config() -> dict[str, str]:
     }
 
 
+def _build_http_session() -> aiohttp.ClientSession:
+    # One keep-alive pool shared by the controller and every instance object it
+    # returns, so concurrent target calls reuse TCP/TLS connections.
+    connector = aiohttp.TCPConnector(limit=0, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75)
+    return aiohttp.ClientSession(connector=connector)
+
+
 def _require_value(name: str, env_name: str, config: dict[str, str]) -> str:
     value = os.getenv(env_name, "").strip() or config.get(name, "").strip()
     if not value:
@@ -76,87 +140,110 @@ def _is_ads_instance(module: object, instance_name: object) -> bool:
 
 
 def _extract_template_group(friendly_name: str) -> str | None:
-    # Expected pattern example: "Some Name -TEMPLATE GROUP-"
-    match = re.search(r"-\s*template\s+([^-]+?)\s*-", friendly_name, flags=re.IGNORECASE)
+    match = _TEMPLATE_RE.search(friendly_name)
     if match is None:
         return None
     group = match.group(1).strip()
     return group or None
 
 
-def _has_destination_group(friendly_name: str, group: str) -> bool:
-    return f"-{group.lower()}-" in friendly_name.lower()
+def _destination_marker(group: str) -> str:
+    return f"-{group.lower()}-"
 
 
-def _find_master_template_instance(instances_by_id: dict[str, object]) -> tuple[object | None, str | None]:
-    matches: list[object] = []
-    for instance in instances_by_id.values():
-        instance_name = str(getattr(instance, "instance_name", ""))
-        module = str(getattr(instance, "module", ""))
-        if _is_ads_instance(module=module, instance_name=instance_name):
+def _has_destination_group(friendly_name: str, marker: str) -> bool:
+    return marker in friendly_name.lower()
+
+
+def _find_master_template_instance(instance_rows: list[InstanceRow]) -> tuple[InstanceRow | None, str | None]:
+    # Single pass: keep the template instance with the lowest instance name.
+    selected: InstanceRow | None = None
+    selected_group: str | None = None
+    for row in instance_rows:
+        if _is_ads_instance(module=row.module, instance_name=row.instance_name):
+            continue
+        if selected is not None and row.instance_name >= selected.instance_name:
             continue
-        friendly_name = str(getattr(instance, "friendly_name", ""))
-        if _extract_template_group(friendly_name) is not None:
-            matches.append(instance)
-
-    if not matches:
-        return None, None
-    matches.sort(key=lambda i: str(getattr(i, "instance_name", "")))
-    selected = matches[0]
-    selected_group = _extract_template_group(str(getattr(selected, "friendly_name", "")))
+        group = _extract_template_group(row.friendly_name)
+        if group is not None:
+            selected, selected_group = row, group
     return selected, selected_group
 
 
 def _serialize_value(value: Any) -> str:
-    if isinstance(value, bool):
+    # Exact type checks first for the common leaf types; subclasses (e.g. enums)
+    # fall through to the isinstance checks below.
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is bool:
         return "true" if value else "false"
     if value is None:
         return ""
+    if value_type is int or value_type is float:
+        return str(value)
     if isinstance(value, (int, float, str)):
         return str(value)
-    return json.dumps(value, separators=(",", ":"))
+    return _json_dumps_compact(value)
 
 
 def _v(item: object, key: str, default: Any = None) -> Any:
-    if isinstance(item, dict):
-        return item.get(key, default)
-    return getattr(item, key, default)
+    # Items are raw dicts or formatted ampapi objects; resolve the accessor once per (type, key).
+    cache_key = (type(item), key)
+    accessor = _ACCESSOR_CACHE.get(cache_key)
+    if accessor is None:
+        accessor = operator.itemgetter(key) if isinstance(item, dict) else operator.attrgetter(key)
+        _ACCESSOR_CACHE[cache_key] = accessor
+    try:
+        return accessor(item)
+    except (KeyError, AttributeError):
+        return default
 
 
-def _iter_trigger_tasks(trigger: object) -> list[object]:
+def _iter_trigger_tasks(trigger: object) -> Collection[object]:
+    # Returns the dict view as-is; callers iterate or sort it, so no copy is needed.
     tasks = _v(trigger, "tasks", []) or []
     if isinstance(tasks, dict):
-        return list(tasks.values())
+        return tasks.values()
     if isinstance(tasks, list):
         return tasks
-    return []
+    return ()
 
 
+@lru_cache(maxsize=1024)
 def _normalize_param_key(name: str) -> str:
-    return "".join(ch for ch in name.lower() if ch.isalnum())
-
-
-def _build_method_consumes_map(schedule_data: object) -> dict[str, list[str]]:
-    methods = _v(schedule_data, "available_methods", []) or []
-    result: dict[str, list[str]] = {}
-    for method in methods:
-        method_id = str(_v(method, "id", "")).strip()
+    return _PARAM_KEY_STRIP_RE.sub("", name.lower())
+
+
+def _build_method_consumes_map(schedule_data: object) -> dict[str, list[tuple[str, str]]]:
+    # Maps method id -> [(consume name, normalized consume name), ...].
+    methods = list(_v(schedule_data, "available_methods", []) or [])
+    result: dict[str, list[tuple[str, str]]] = {}
+    if not methods:
+        return result
+    # Schedule payloads are either all raw dicts or all formatted objects, so
+    # pick the accessor once instead of per element.
+    if isinstance(methods[0], dict):
+        method_pairs = ((m.get("id", ""), m.get("consumes", [])) for m in methods)
+    else:
+        method_pairs = ((getattr(m, "id", ""), getattr(m, "consumes", [])) for m in methods)
+    for raw_id, raw_consumes in method_pairs:
+        method_id = str(raw_id).strip()
         if not method_id:
             continue
-        consumes = _v(method, "consumes", []) or []
-        names: list[str] = []
-        for consume in consumes:
-            name = str(_v(consume, "name", "")).strip()
-            if name:
-                names.append(name)
-        result[method_id] = names
+        consumes = list(raw_consumes or [])
+        if consumes and isinstance(consumes[0], dict):
+            names = [str(c.get("name", "")).strip() for c in consumes]
+        else:
+            names = [str(getattr(c, "name", "")).strip() for c in consumes]
+        result[method_id] = [(name, _normalize_param_key(name)) for name in names if name]
     return result
 
 
 def _remap_parameter_mapping_for_method(
     method_id: str,
     mapping: dict[str, str],
-    consumes_map: dict[str, list[str]],
+    consumes_map: dict[str, list[tuple[str, str]]],
 ) -> dict[str, str]:
     expected = consumes_map.get(method_id, [])
     if not expected:
@@ -167,8 +254,8 @@ def _remap_parameter_mapping_for_method(
         source_by_norm[_normalize_param_key(str(key))] = str(value)
 
     remapped: dict[str, str] = {}
-    for target_name in expected:
-        source_value = source_by_norm.get(_normalize_param_key(target_name))
+    for target_name, norm_target in expected:
+        source_value = source_by_norm.get(norm_target)
         if source_value is not None:
             remapped[target_name] = source_value
 
@@ -180,9 +267,11 @@ def _remap_parameter_mapping_for_method(
 
 
 def _parameter_mapping_to_dict(mapping: object) -> dict[str, str]:
+    # Raw template schedules (format_data=False) hand us plain dicts.
+    if type(mapping) is dict or isinstance(mapping, dict):
+        return {str(k): _serialize_value(v) for k, v in mapping.items()}
     if mapping is None:
         return {}
-    if isinstance(mapping, dict):
         return {str(k): _serialize_value(v) for k, v in mapping.items()}
     if hasattr(mapping, "__dict__"):
         return {
@@ -215,20 +304,19 @@ def _distributed_minute(index: int, total: int) -> int:
 
 
 def _distributed_minute_avoiding(index: int, total: int, blocked_minute: int) -> int:
-    allowed = [m for m in range(60) if m != blocked_minute]
-    if not allowed:
-        return blocked_minute
-    if total <= 0:
-        return allowed[0]
-    pos = int((index * len(allowed)) / total)
-    if pos >= len(allowed):
-        pos = len(allowed) - 1
-    return allowed[pos]
+    # Spread over the minutes of the hour except blocked_minute, computed
+    # arithmetically: positions at or past the blocked minute shift up by one.
+    slots = 59 if 0 <= blocked_minute < 60 else 60
+    pos = min((index * slots) // total, slots - 1) if total > 0 else 0
+    return pos + 1 if 0 <= blocked_minute <= pos else pos
 
 
-def _build_replicated_description(base_description: str, template_name: str, run_stamp: str) -> str:
-    base = base_description.strip() or "Scheduled Trigger"
-    return f"{base} | replicated from {template_name} {run_stamp}"
+def _build_replicated_suffix(template_name: str, run_stamp: str) -> str:
+    return f" | replicated from {template_name} {run_stamp}"
+
+
+def _build_replicated_description(base_description: str, replicated_suffix: str) -> str:
+    return f"{base_description.strip() or 'Scheduled Trigger'}{replicated_suffix}"
 
 
 def _trigger_summary(trigger: object) -> str:
@@ -244,30 +332,39 @@ async def _get_schedule(instance_obj: object) -> object | ActionResultError:
 
 async def _get_target_instances(
     ads: SafeAMPControllerInstance,
-    instances_by_id: dict[str, object],
+    instance_rows: list[InstanceRow],
     master_instance_name: str,
     template_group: str,
 ) -> list[object]:
-    targets: list[object] = []
-    for meta in sorted(instances_by_id.values(), key=lambda x: str(getattr(x, "instance_name", ""))):
-        instance_name = str(getattr(meta, "instance_name", ""))
-        module = str(getattr(meta, "module", ""))
-        if _is_ads_instance(module=module, instance_name=instance_name):
+    candidates: list[tuple[str, str]] = []
+    marker = _destination_marker(template_group)
+    for row in sorted(instance_rows, key=operator.attrgetter("instance_name")):
+        instance_name = row.instance_name
+        if _is_ads_instance(module=row.module, instance_name=instance_name):
             continue
         if instance_name == master_instance_name:
             continue
-        friendly_name = str(getattr(meta, "friendly_name", ""))
-        if not _has_destination_group(friendly_name=friendly_name, group=template_group):
+        if not _has_destination_group(friendly_name=row.friendly_name, marker=marker):
             print(f"- skip {instance_name}: missing destination marker -{template_group}-")
             continue
-        if not bool(getattr(meta, "running", False)):
+        if not row.running:
             print(f"- skip {instance_name}: unavailable/offline")
             continue
-        instance_id = str(getattr(meta, "instance_id", ""))
-        if not instance_id:
-            continue
-        instance_obj = await ads.get_instance(instance_id=instance_id, format_data=True)
-        if isinstance(instance_obj, ActionResultError):
+        candidates.append((instance_name, row.instance_id))
+
+    semaphore = asyncio.Semaphore(_INSTANCE_FETCH_CONCURRENCY)
+
+    async def _load(instance_id: str) -> object:
+        async with semaphore:
+            return await ads.get_instance(instance_id=instance_id, format_data=True)
+
+    results = await asyncio.gather(
+        *[_load(instance_id) for _, instance_id in candidates],
+        return_exceptions=True,
+    )
+    targets: list[object] = []
+    for (instance_name, _), instance_obj in zip(candidates, results):
+        if isinstance(instance_obj, (ActionResultError, BaseException)):
             print(f"- skip {instance_name}: failed to load instance ({instance_obj})")
             continue
         targets.append(instance_obj)
@@ -315,53 +412,47 @@ async def _load_template_interval_details(template_obj: object, template_trigger
     }
 
 
-async def _find_new_trigger_id_after_create(
+async def _find_new_trigger_after_create(
     target_obj: object,
-    before_ids: set[str],
+    known_ids: set[str],
     expected_description: str,
     preferred_id: str | None = None,
-) -> str | None:
+) -> object | None:
+    # known_ids holds every trigger id seen on the target so far; it is updated
+    # with this refresh so the next create can be diffed without another fetch.
     schedule_after = await _get_schedule(target_obj)
     if isinstance(schedule_after, ActionResultError):
         return None
 
     populated_after = getattr(schedule_after, "populated_triggers", []) or []
-    if preferred_id and any(str(getattr(t, "id", "")) == preferred_id for t in populated_after):
-        if preferred_id not in before_ids:
-            return preferred_id
-    new_triggers = [t for t in populated_after if str(getattr(t, "id", "")) not in before_ids]
+    new_triggers = [t for t in populated_after if str(getattr(t, "id", "")) not in known_ids]
+    known_ids.update(str(getattr(t, "id", "")) for t in new_triggers)
     if not new_triggers:
         return None
 
+    if preferred_id:
+        preferred = next((t for t in new_triggers if str(getattr(t, "id", "")) == preferred_id), None)
+        if preferred is not None:
+            return preferred
     for trg in new_triggers:
         if str(getattr(trg, "description", "")) == expected_description:
-            return str(getattr(trg, "id", "")) or None
-    return str(getattr(new_triggers[0], "id", "")) or None
-
+            return trg
+    return new_triggers[0]
 
-async def _clear_trigger_tasks(target_obj: object, trigger_id: str) -> None:
-    schedule = await target_obj.get_schedule_data(format_data=False)
-    if isinstance(schedule, ActionResultError) or not isinstance(schedule, dict):
-        return
-    populated = schedule.get("populated_triggers", []) or []
-    trigger = next((t for t in populated if str(t.get("id", "")) == trigger_id), None)
-    if not isinstance(trigger, dict):
-        return
-    tasks = trigger.get("tasks", []) or []
-    if isinstance(tasks, dict):
-        task_items = list(tasks.values())
-    elif isinstance(tasks, list):
-        task_items = tasks
-    else:
-        task_items = []
 
-    for task in task_items:
+async def _clear_trigger_tasks(
+    target_obj: object,
+    trigger_id: str,
+    existing_tasks: Collection[object],
+    log: Callable[[str], None] = print,
+) -> None:
+    for task in existing_tasks:
         task_id = str(_v(task, "id", "")).strip()
         if not task_id:
             continue
         res = await target_obj.delete_task(trigger_id=trigger_id, task_id=task_id, format_data=True)
         if isinstance(res, ActionResultError):
-            print(f"  - existing task delete failed: task_id={task_id} ({res})")
+            log(f"  - existing task delete failed: task_id={task_id} ({res})")
 
 
 async def _add_interval_trigger_raw(target_obj: object, interval_cfg: dict[str, Any]) -> object | ActionResultError:
@@ -379,36 +470,64 @@ async def _add_interval_trigger_raw(target_obj: object, interval_cfg: dict[str,
 
 async def _sync_schedule_for_target(
     target_obj: object,
-    template_obj: object,
     template_schedule: object,
+    template_intervals: dict[str, dict[str, Any] | None],
+    dry_run: bool,
+    target_index: int,
+    target_total: int,
+    replicated_suffix: str,
+    semaphore: asyncio.Semaphore,
+) -> None:
+    # Targets run concurrently; buffer output so each target prints as one block.
+    async with semaphore:
+        lines: list[str] = []
+        try:
+            await _replace_target_schedule(
+                target_obj=target_obj,
+                template_schedule=template_schedule,
+                template_intervals=template_intervals,
+                dry_run=dry_run,
+                target_index=target_index,
+                target_total=target_total,
+                replicated_suffix=replicated_suffix,
+                log=lines.append,
+            )
+        finally:
+            print("\n".join(lines))
+
+
+async def _replace_target_schedule(
+    target_obj: object,
+    template_schedule: object,
+    template_intervals: dict[str, dict[str, Any] | None],
     dry_run: bool,
     target_index: int,
     target_total: int,
-    template_name: str,
-    run_stamp: str,
+    replicated_suffix: str,
+    log: Callable[[str], None],
 ) -> None:
     target_name = str(getattr(target_obj, "instance_name", "<unknown>"))
     target_friendly = str(getattr(target_obj, "friendly_name", target_name))
-    print(f"\nTarget: {target_friendly} ({target_name})")
+    log(f"\nTarget: {target_friendly} ({target_name})")
 
     target_schedule = await _get_schedule(target_obj)
     if isinstance(target_schedule, ActionResultError):
-        print(f"- failed to read target schedule: {target_schedule}")
+        log(f"- failed to read target schedule: {target_schedule}")
         return
 
     target_populated = list(getattr(target_schedule, "populated_triggers", []) or [])
     template_populated = list(_v(template_schedule, "populated_triggers", []) or [])
-    print(f"- existing triggers on target: {len(target_populated)}")
-    print(f"- template triggers to clone: {len(template_populated)}")
+    log(f"- existing triggers on target: {len(target_populated)}")
+    log(f"- template triggers to clone: {len(template_populated)}")
 
     for trigger in target_populated:
         trigger_id = str(getattr(trigger, "id", ""))
-        print(f"- delete trigger: {_trigger_summary(trigger)}")
+        log(f"- delete trigger: {_trigger_summary(trigger)}")
         if dry_run:
             continue
         result = await target_obj.delete_trigger(trigger_id=trigger_id, format_data=True)
         if isinstance(result, ActionResultError):
-            print(f"  - delete failed: {result}")
+            log(f"  - delete failed: {result}")
 
     if dry_run:
         for template_trigger in template_populated:
@@ -417,7 +536,7 @@ async def _sync_schedule_for_target(
             if not _trigger_has_backup_task(template_trigger):
                 continue
             template_minute = 0
-            interval_cfg = await _load_template_interval_details(template_obj, template_trigger)
+            interval_cfg = template_intervals.get(str(_v(template_trigger, "id", "")))
             if interval_cfg is not None:
                 template_minutes = list(interval_cfg.get("minutes", []) or [0])
                 template_minute = int(template_minutes[0]) if template_minutes else 0
@@ -426,44 +545,45 @@ async def _sync_schedule_for_target(
                 total=target_total,
                 blocked_minute=template_minute,
             )
-            print(
+            log(
                 f"- dry-run backup minute plan: "
                 f"{_v(template_trigger, 'description', '<unknown>')} -> {planned_minute:02d}"
             )
-        print("- dry-run: skip create/apply steps")
+        log("- dry-run: skip create/apply steps")
         return
 
-    # Refresh once after deletes.
-    target_schedule = await _get_schedule(target_obj)
-    if isinstance(target_schedule, ActionResultError):
-        print(f"- failed to refresh target schedule after delete: {target_schedule}")
-        return
-
-    target_available = list(getattr(target_schedule, "available_triggers", []) or [])
+    # Refresh once after deletes; with nothing deleted the first read is still current.
+    if target_populated:
+        target_schedule = await _get_schedule(target_obj)
+        if isinstance(target_schedule, ActionResultError):
+            log(f"- failed to refresh target schedule after delete: {target_schedule}")
+            return
+
+    # Event triggers on the target keyed by description; the first match wins.
+    available_by_desc: dict[str, object] = {}
+    for available in getattr(target_schedule, "available_triggers", []) or []:
+        if not _is_interval_trigger(available):
+            available_by_desc.setdefault(str(getattr(available, "description", "")), available)
     method_consumes = _build_method_consumes_map(target_schedule)
 
+    known_ids = {str(getattr(t, "id", "")) for t in (getattr(target_schedule, "populated_triggers", []) or [])}
+    created: list[tuple[str, str, Collection[object] | None, Collection[object], bool]] = []
     for template_trigger in template_populated:
         trigger_desc = str(_v(template_trigger, "description", ""))
         trigger_enabled = bool(_v(template_trigger, "enabled_state", False))
         trigger_tasks = _iter_trigger_tasks(template_trigger)
         is_interval = _is_interval_trigger(template_trigger)
 
-        before_schedule = await _get_schedule(target_obj)
-        if isinstance(before_schedule, ActionResultError):
-            print(f"- failed to read target schedule before create: {before_schedule}")
-            continue
-        before_ids = {str(getattr(t, "id", "")) for t in (getattr(before_schedule, "populated_triggers", []) or [])}
-
         source_trigger_id: str | None = None
         if is_interval:
-            interval_cfg = await _load_template_interval_details(template_obj, template_trigger)
+            # Copy: the shared template config is adjusted per target below.
+            interval_cfg = copy.deepcopy(template_intervals.get(str(_v(template_trigger, "id", ""))))
             if interval_cfg is None:
-                print(f"- create interval trigger skipped (could not read template interval details): {trigger_desc}")
+                log(f"- create interval trigger skipped (could not read template interval details): {trigger_desc}")
                 continue
             interval_cfg["description"] = _build_replicated_description(
                 base_description=trigger_desc,
-                template_name=template_name,
-                run_stamp=run_stamp,
+                replicated_suffix=replicated_suffix,
             )
             if _trigger_has_backup_task(template_trigger):
                 old_minutes_list = list(interval_cfg.get("minutes", []) or [0])
@@ -488,94 +608,156 @@ async def _sync_schedule_for_target(
                     seen_minutes.add(int_value)
                     deduped_minutes.append(int_value)
                 interval_cfg["minutes"] = deduped_minutes
-                print(
+                log(
                     f"  - backup interval minute adjusted for spread: "
                     f"{trigger_desc} {old_minute:02d} -> {new_minutes:02d} "
                     f"(template minute blocked)"
                 )
             create_result = await _add_interval_trigger_raw(target_obj=target_obj, interval_cfg=interval_cfg)
             if isinstance(create_result, ActionResultError):
-                print(f"- create interval trigger failed: {trigger_desc} ({create_result})")
+                log(f"- create interval trigger failed: {trigger_desc} ({create_result})")
                 continue
         else:
             # Map template event trigger description to target available trigger ID.
-            match = next(
-                (
-                    t
-                    for t in target_available
-                    if str(getattr(t, "description", "")) == trigger_desc
-                    and not _is_interval_trigger(t)
-                ),
-                None,
-            )
+            match = available_by_desc.get(trigger_desc)
             if match is None:
-                print(f"- create event trigger skipped (no target match): {trigger_desc}")
+                log(f"- create event trigger skipped (no target match): {trigger_desc}")
                 continue
             source_trigger_id = str(getattr(match, "id", ""))
             create_result = await target_obj.add_event_trigger(trigger_id=source_trigger_id, format_data=True)
             if isinstance(create_result, ActionResultError):
-                print(f"- create event trigger failed: {trigger_desc} ({create_result})")
+                log(f"- create event trigger failed: {trigger_desc} ({create_result})")
                 continue
 
-        new_trigger_id = await _find_new_trigger_id_after_create(
+        new_trigger = await _find_new_trigger_after_create(
             target_obj=target_obj,
-            before_ids=before_ids,
+            known_ids=known_ids,
             expected_description=(
                 str(interval_cfg["description"]) if is_interval else trigger_desc
             ),
             preferred_id=source_trigger_id,
         )
+        new_trigger_id = str(getattr(new_trigger, "id", "")) if new_trigger is not None else ""
         if not new_trigger_id:
-            print(f"- trigger created but new trigger id not found: {trigger_desc}")
+            log(f"- trigger created but new trigger id not found: {trigger_desc}")
             continue
 
-        print(f"- created trigger: {trigger_desc} -> {new_trigger_id}")
+        log(f"- created trigger: {trigger_desc} -> {new_trigger_id}")
 
         if is_interval:
-            print(f"  - interval trigger configured: {interval_cfg['description']}")
+            log(f"  - interval trigger configured: {interval_cfg['description']}")
         else:
-            print(
+            log(
                 "  - event trigger naming unchanged by AMP API "
                 f"(template trigger: {trigger_desc})"
             )
-            await _clear_trigger_tasks(target_obj=target_obj, trigger_id=new_trigger_id)
-
-        sorted_tasks = sorted(trigger_tasks, key=lambda x: int(_v(x, "order", 0)))
-        for task in sorted_tasks:
-            method_id = str(_v(task, "task_method_name", "")).strip()
-            if not method_id:
-                print("  - task skipped: missing method")
-                continue
-            mapping = _parameter_mapping_to_dict(_v(task, "parameter_mapping", {}))
-            mapping = _remap_parameter_mapping_for_method(
-                method_id=method_id,
-                mapping=mapping,
-                consumes_map=method_consumes,
-            )
-            add_task_result = await target_obj.add_task(
+        # Event triggers may come with default tasks; those are cleared before populating.
+        existing_tasks = None if is_interval else _iter_trigger_tasks(new_trigger)
+        created.append((trigger_desc, new_trigger_id, existing_tasks, trigger_tasks, trigger_enabled))
+
+    # Trigger ids are only known after each create, so creation stays sequential.
+    # Task population is independent per trigger and runs concurrently; each
+    # trigger still adds its own tasks in template order.
+    # A failing trigger must not drop the other triggers' output or leave them running
+    # unattended, so every trigger is awaited to completion before any failure is raised.
+    populate_logs: list[list[str]] = [[] for _ in created]
+    populate_results = await asyncio.gather(
+        *[
+            _populate_created_trigger(
+                target_obj=target_obj,
+                trigger_desc=trigger_desc,
                 trigger_id=new_trigger_id,
-                method_id=method_id,
-                parameter_mapping=mapping,
-                format_data=True,
+                existing_tasks=existing_tasks,
+                trigger_tasks=trigger_tasks,
+                trigger_enabled=trigger_enabled,
+                method_consumes=method_consumes,
+                log=trigger_lines.append,
             )
-            if isinstance(add_task_result, ActionResultError):
-                print(f"  - task add failed: method={method_id} ({add_task_result})")
-                continue
-            print(f"  - task added: method={method_id}")
+            for (trigger_desc, new_trigger_id, existing_tasks, trigger_tasks, trigger_enabled), trigger_lines in zip(
+                created, populate_logs
+            )
+        ],
+        return_exceptions=True,
+    )
+    first_error: BaseException | None = None
+    for entry, trigger_lines, result in zip(created, populate_logs, populate_results):
+        for line in trigger_lines:
+            log(line)
+        if isinstance(result, BaseException):
+            log(f"  - populate failed: {entry[0]} ({entry[1]}): {result!r}")
+            if first_error is None:
+                first_error = result
+    if first_error is not None:
+        raise first_error
+
+
+async def _populate_created_trigger(
+    target_obj: object,
+    trigger_desc: str,
+    trigger_id: str,
+    existing_tasks: Collection[object] | None,
+    trigger_tasks: Collection[object],
+    trigger_enabled: bool,
+    method_consumes: dict[str, list[tuple[str, str]]],
+    log: Callable[[str], None],
+) -> None:
+    log(f"- populate trigger: {trigger_desc} ({trigger_id})")
+
+    if existing_tasks:
+        await _clear_trigger_tasks(
+            target_obj=target_obj,
+            trigger_id=trigger_id,
+            existing_tasks=existing_tasks,
+            log=log,
+        )
 
-        set_enabled_result = await target_obj.set_trigger_enabled(
-            trigger_id=new_trigger_id,
-            enabled=trigger_enabled,
+    if isinstance(next(iter(trigger_tasks), None), dict):
+        sorted_tasks = sorted(trigger_tasks, key=lambda x: int(x.get("order", 0)))
+    else:
+        sorted_tasks = sorted(trigger_tasks, key=lambda x: int(getattr(x, "order", 0)))
+    # AMP has no bulk task endpoint (only Core/AddTask) and orders tasks by insertion,
+    # and AddTask does not return the new task id to reorder afterwards. Tasks of one
+    # trigger therefore stay sequential; concurrency happens across triggers instead.
+    for task in sorted_tasks:
+        method_id = str(_v(task, "task_method_name", "")).strip()
+        if not method_id:
+            log("  - task skipped: missing method")
+            continue
+        mapping = _parameter_mapping_to_dict(_v(task, "parameter_mapping", {}))
+        mapping = _remap_parameter_mapping_for_method(
+            method_id=method_id,
+            mapping=mapping,
+            consumes_map=method_consumes,
+        )
+        add_task_result = await target_obj.add_task(
+            trigger_id=trigger_id,
+            method_id=method_id,
+            parameter_mapping=mapping,
             format_data=True,
         )
-        if isinstance(set_enabled_result, ActionResultError):
-            print(f"  - set trigger enabled failed: {set_enabled_result}")
-        else:
-            print(f"  - trigger enabled state set: {trigger_enabled}")
+        if isinstance(add_task_result, ActionResultError):
+            log(f"  - task add failed: method={method_id} ({add_task_result})")
+            continue
+        log(f"  - task added: method={method_id}")
+
+    set_enabled_result = await target_obj.set_trigger_enabled(
+        trigger_id=trigger_id,
+        enabled=trigger_enabled,
+        format_data=True,
+    )
+    if isinstance(set_enabled_result, ActionResultError):
+        log(f"  - set trigger enabled failed: {set_enabled_result}")
+    else:
+        log(f"  - trigger enabled state set: {trigger_enabled}")
 
 
-async def _run_schedule_sync(ads: SafeAMPControllerInstance, instances_by_id: dict[str, object], dry_run: bool) -> int:
-    master_template, template_group = _find_master_template_instance(instances_by_id=instances_by_id)
+async def _run_schedule_sync(
+    ads: SafeAMPControllerInstance,
+    instance_rows: list[InstanceRow],
+    dry_run: bool,
+    concurrency: int,
+) -> int:
+    master_template, template_group = _find_master_template_instance(instance_rows=instance_rows)
     if master_template is None:
         print("Master template not found. Friendly name must match pattern '-TEMPLATE <GROUP>-'.")
         return 5
@@ -583,9 +765,9 @@ async def _run_schedule_sync(ads: SafeAMPControllerInstance, instances_by_id: di
         print("Master template selected but no template group parsed from friendly name.")
         return 5
 
-    template_name = str(getattr(master_template, "instance_name", "<unknown>"))
-    template_friendly = str(getattr(master_template, "friendly_name", "<unknown>"))
-    template_id = str(getattr(master_template, "instance_id", ""))
+    template_name = master_template.instance_name or "<unknown>"
+    template_friendly = master_template.friendly_name or "<unknown>"
+    template_id = master_template.instance_id
     print(f"Master template selected: {template_friendly} ({template_name})")
     print(f"Template group: {template_group} (destinations require '-{template_group}-' in friendly name)")
 
@@ -610,7 +792,7 @@ async def _run_schedule_sync(ads: SafeAMPControllerInstance, instances_by_id: di
 
     targets = await _get_target_instances(
         ads=ads,
-        instances_by_id=instances_by_id,
+        instance_rows=instance_rows,
         master_instance_name=template_name,
         template_group=template_group,
     )
@@ -624,21 +806,59 @@ async def _run_schedule_sync(ads: SafeAMPControllerInstance, instances_by_id: di
     print(f"Replication stamp (UTC): {run_stamp}")
     print(f"Target instances: {len(targets)}")
 
-    for idx, target in enumerate(targets):
-        await _sync_schedule_for_target(
-            target_obj=target,
-            template_obj=template_obj,
-            template_schedule=template_schedule,
-            dry_run=dry_run,
-            target_index=idx,
-            target_total=len(targets),
-            template_name=template_name,
-            run_stamp=run_stamp,
-        )
+    # Interval details depend only on the template, so load them once for all targets.
+    interval_triggers = [t for t in template_populated if _is_interval_trigger(t)]
+    interval_details = await asyncio.gather(
+        *[_load_template_interval_details(template_obj, t) for t in interval_triggers]
+    )
+    template_intervals: dict[str, dict[str, Any] | None] = {
+        str(_v(t, "id", "")): cfg for t, cfg in zip(interval_triggers, interval_details)
+    }
 
+    replicated_suffix = _build_replicated_suffix(template_name=template_name, run_stamp=run_stamp)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results = await asyncio.gather(
+        *[
+            _sync_schedule_for_target(
+                target_obj=target,
+                template_schedule=template_schedule,
+                template_intervals=template_intervals,
+                dry_run=dry_run,
+                target_index=idx,
+                target_total=len(targets),
+                replicated_suffix=replicated_suffix,
+                semaphore=semaphore,
+            )
+            for idx, target in enumerate(targets)
+        ],
+        return_exceptions=True,
+    )
+    failed = 0
+    for target, result in zip(targets, results):
+        if isinstance(result, BaseException):
+            failed += 1
+            target_name = str(getattr(target, "instance_name", "<unknown>"))
+            print(f"\nTarget sync failed: {target_name} ({result!r})")
+
+    if failed:
+        print(f"\n{failed} of {len(targets)} target(s) failed.")
+        return 9
     return 0
 
 
+def _run(coro: Coroutine[Any, Any, int]) -> int:
+    # Optional: uvloop lowers per-callback overhead for the many concurrent AMP calls.
+    # The loop is chosen here rather than through a global event loop policy (deprecated).
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Replace target schedules with template schedule.")
     parser.add_argument(
@@ -646,6 +866,12 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Preview deletes/creates without applying schedule changes.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of target instances synced in parallel (default: 4).",
+    )
     return parser.parse_args()
 
 
@@ -659,7 +885,8 @@ async def main() -> int:
     params = APIParams(url=amp_url, user=amp_user, password=amp_pass)
     Bridge(api_params=params)
 
-    ads = SafeAMPControllerInstance()
+    # Closed by ads.close_all() / ads.__adel__() below.
+    ads = SafeAMPControllerInstance(session=_build_http_session())
     logged_in = False
     try:
         login_result = await ads.login(amp_user=amp_user, amp_password=amp_pass)
@@ -673,12 +900,12 @@ async def main() -> int:
             print(f"Instance list query failed: {instances}")
             return 4
 
-        instances_by_id: dict[str, object] = {
-            getattr(instance, "instance_id", ""): instance
-            for instance in instances
-            if getattr(instance, "instance_id", "")
-        }
-        return await _run_schedule_sync(ads=ads, instances_by_id=instances_by_id, dry_run=args.dry_run)
+        return await _run_schedule_sync(
+            ads=ads,
+            instance_rows=_build_instance_rows(instances),
+            dry_run=args.dry_run,
+            concurrency=args.concurrency,
+        )
     finally:
         if logged_in:
             await ads.close_all()
@@ -688,7 +915,7 @@ async def main() -> int:
 
 if __name__ == "__main__":
     try:
-        raise SystemExit(asyncio.run(main()))
+        raise SystemExit(_run(main()))
     except RuntimeError as exc:
         print(str(exc))
         raise SystemExit(1)
@@ -1,16 +1,28 @@
 #!/usr/bin/env python3
 import argparse
 import asyncio
+import functools
+from itertools import chain
 import json
+from operator import itemgetter
 import os
 from pathlib import Path
 import re
 import sys
+from typing import Any, Awaitable, Callable, Iterable
 
+import aiohttp
 from ampapi import AMPControllerInstance, APIParams, Bridge
 from ampapi.modules import ActionResultError
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing when installed.
+    orjson = None
+
 ARKSA_GROUP_KEY = "arksa:stadiacontroller"
+# Module name / instance name prefix of the AMP controller (ADS) itself.
+_ADS = "ADS"
 BACKUP_GROUP_KEYWORDS = ("backup", "local", "cloud", "s3")
 # Per-instance identity/location fields that should not be cloned from master.
 ARKSA_SKIP_NODES = {
@@ -22,20 +34,44 @@ ARKSA_SKIP_NODES = {
     "Meta.GenericModule.CustomMap",
     "GenericModule.CustomMap",
 }
+# Setting node prefixes treated as game-related in the generic template settings output.
+GAME_NODE_PREFIXES = (
+    "GenericModule.",
+    "steamcmdplugin.",
+    "RCONPlugin.",
+    "Meta.GenericModule.",
+)
+# Menu section per ARK SA setting subcategory prefix ("<prefix>:..."); anything else is "Overall".
+ARKSA_SUBCATEGORY_BUCKETS = {
+    "server": "Server",
+    "gameplay": "Gameplay",
+    "multipliers": "Multipliers",
+    "structures": "Structures",
+    "clusters": "Clusters",
+}
 # Force specific config values on all destination targets.
 ARKSA_FORCED_NODE_VALUES = {
     "GenericModule.App.UseRandomAdminPassword": "false",
 }
+# Expected pattern example: "Some Name -TEMPLATE GROUP-"
+_TEMPLATE_GROUP_RE = re.compile(r"-\s*template\s+([^-]+?)\s*-", re.IGNORECASE)
+# Upper bound on concurrent per-instance requests against the AMP controller.
+MAX_CONCURRENT_REQUESTS = 16
+# Shared by every fan-out (discovery, status listing, sync planning) so the cap holds run-wide.
+# Awaitables run under it must not call _gather_limited themselves, or they can deadlock.
+_REQUEST_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
 
 class SafeAMPControllerInstance(AMPControllerInstance):
-    # ampapi's __del__ may invoke asyncio.run() during interpreter teardown.
-    # We explicitly close the session in main(), so this no-op avoids warning noise.
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        super().__init__(session=session)
         self._tracked_instances: list[object] = []
         self._tracked_instance_ids: set[str] = set()
 
+    # ampapi's __del__ may invoke asyncio.run() during interpreter teardown.
+    # main() closes the session explicitly (close_all / __adel__), so the finalizer is a no-op.
+    # It has to stay a real method: object defines no __del__ to alias, and __del__ = None
+    # would make every finalization raise "'NoneType' object is not callable".
     def __del__(self) -> None:
         return
 
@@ -66,29 +102,132 @@ class SafeAMPControllerInstance(AMPControllerInstance):
         await self.__adel__()
 
 
+class AmpBatcher:
+    # Coalesces repeated per-instance reads within one run. AMP has no bulk endpoints,
+    # so each distinct request is still sent on its own, but callers asking for the
+    # same instance (or the same instance's setting spec) share one in-flight request
+    # and its result. Failed results are not kept, so a later caller retries.
+    def __init__(self, ads: SafeAMPControllerInstance) -> None:
+        self._ads = ads
+        self._requests: dict[tuple[object, ...], asyncio.Future[Any]] = {}
+
+    async def _coalesce(self, key: tuple[object, ...], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        request = self._requests.get(key)
+        if request is None:
+            request = asyncio.ensure_future(fetch())
+            self._requests[key] = request
+        try:
+            # Shielded so one cancelled caller does not cancel the fetch for the others sharing it.
+            result = await asyncio.shield(request)
+        except BaseException:
+            # Only forget a fetch that itself failed; a cancelled caller leaves it in flight for the rest.
+            if request.done() and self._requests.get(key) is request:
+                del self._requests[key]
+            raise
+        if isinstance(result, ActionResultError) and self._requests.get(key) is request:
+            del self._requests[key]
+        return result
+
+    async def get_instance(self, instance_id: str) -> object:
+        return await self._coalesce(
+            ("instance", instance_id),
+            lambda: self._ads.get_instance(instance_id=instance_id, format_data=True),
+        )
+
+    async def get_setting_spec(self, instance_obj: object, format_data: bool = False) -> object:
+        instance_id = str(getattr(instance_obj, "instance_id", ""))
+        return await self._coalesce(
+            ("setting_spec", instance_id, format_data),
+            lambda: instance_obj.get_setting_spec(format_data=format_data),
+        )
+
+
+_LOG_LINES: list[str] = []
+
+
+def _log(message: str = "") -> None:
+    # Buffered print for the long, line-heavy phases; see _flush_log().
+    _LOG_LINES.append(message)
+
+
+def _flush_log() -> None:
+    # One write per natural boundary instead of one (possibly flushed) write per line.
+    if _LOG_LINES:
+        sys.stdout.write("\n".join(_LOG_LINES) + "\n")
+        sys.stdout.flush()
+        _LOG_LINES.clear()
+
+
+def _flush_log_after(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _flush_log()
+
+    return wrapper
+
+
+async def _gather_limited(aws: Iterable[Awaitable[Any]]) -> list[Any]:
+    # Like asyncio.gather(return_exceptions=True), bounded by the shared request semaphore.
+    async def _run(aw: Awaitable[Any]) -> Any:
+        async with _REQUEST_SEMAPHORE:
+            return await aw
+
+    return await asyncio.gather(*(_run(aw) for aw in aws), return_exceptions=True)
+
+
 def _extract_template_group(friendly_name: str) -> str | None:
-    # Expected pattern example: "Some Name -TEMPLATE GROUP-"
-    match = re.search(r"-\s*template\s+([^-]+?)\s*-", friendly_name, flags=re.IGNORECASE)
+    # Most instances are not templates; reject them without running the regex.
+    # The marker allows whitespace after the dash, so only "template" is checked.
+    if "template" not in friendly_name.lower():
+        return None
+    match = _TEMPLATE_GROUP_RE.search(friendly_name)
     if match is None:
         return None
     group = match.group(1).strip()
     return group or None
 
 
-def _has_destination_group(friendly_name: str, group: str) -> bool:
-    return f"-{group.lower()}-" in friendly_name.lower()
+def _has_destination_group(friendly_lower: str, group: str) -> bool:
+    return f"-{group.lower()}-" in friendly_lower
+
+
+def _friendly_info(friendly_name: object) -> tuple[str, str, str | None]:
+    # (friendly name, lowercased friendly name, template group or None)
+    text = friendly_name if isinstance(friendly_name, str) else str(friendly_name)
+    return text, text.lower(), _extract_template_group(text)
+
+
+def _build_friendly_cache(instances_by_id: dict[str, object]) -> dict[str, tuple[str, str, str | None]]:
+    return {
+        instance_id: _friendly_info(getattr(instance, "friendly_name", ""))
+        for instance_id, instance in instances_by_id.items()
+    }
+
+
+def _is_template_instance_friendly(friendly_info: tuple[str, str, str | None]) -> bool:
+    return friendly_info[2] is not None
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
-def _is_template_instance_friendly(friendly_name: object) -> bool:
-    return _extract_template_group(str(friendly_name)) is not None
+def _json_dumps_compact(value: Any) -> str:
+    # Stays on the stdlib encoder: these strings are sent back to AMP, and orjson differs from
+    # json.dumps (raw UTF-8 instead of \u escapes, float and NaN formatting).
+    return json.dumps(value, separators=(",", ":"))
 
 
 def _read_config() -> dict[str, str]:
     config_path = Path(__file__).resolve().parent / "amp_config.json"
     if not config_path.exists():
         return {}
-    with config_path.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    data = _json_loads(config_path.read_bytes())
     if not isinstance(data, dict):
         raise RuntimeError("amp_config.json must contain a JSON object")
     return {
@@ -98,6 +237,13 @@ def _read_config() -> dict[str, str]:
     }
 
 
+def _build_http_session() -> aiohttp.ClientSession:
+    # One keep-alive pool shared by the controller and every instance object it
+    # returns, so concurrent target calls reuse TCP/TLS connections.
+    connector = aiohttp.TCPConnector(limit=0, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75)
+    return aiohttp.ClientSession(connector=connector)
+
+
 def _require_value(name: str, env_name: str, config: dict[str, str]) -> str:
     value = os.getenv(env_name, "").strip() or config.get(name, "").strip()
     if not value:
@@ -106,25 +252,32 @@ def _require_value(name: str, env_name: str, config: dict[str, str]) -> str:
 
 
 def _is_ads_instance(module: object, instance_name: object) -> bool:
-    return str(module) == "ADS" or str(instance_name).startswith("ADS")
+    # Callers almost always pass strings already; skip the str() copy for them.
+    if (module if isinstance(module, str) else str(module)) == _ADS:
+        return True
+    if isinstance(instance_name, str):
+        return instance_name.startswith(_ADS)
+    return str(instance_name).startswith(_ADS)
 
 
-def _find_master_template_instance(instances_by_id: dict[str, object]) -> tuple[object | None, str | None]:
-    matches: list[object] = []
-    for instance in instances_by_id.values():
+def _find_master_template_instance(
+    instances_by_id: dict[str, object],
+    friendly_cache: dict[str, tuple[str, str, str | None]],
+) -> tuple[object | None, str | None]:
+    # Single pass keeping the template with the lowest instance name (first one wins on ties).
+    selected: object | None = None
+    selected_name = ""
+    selected_group: str | None = None
+    for instance_id, instance in instances_by_id.items():
+        group = friendly_cache[instance_id][2]
+        if group is None:
+            continue
         instance_name = str(getattr(instance, "instance_name", ""))
         module = str(getattr(instance, "module", ""))
         if _is_ads_instance(module=module, instance_name=instance_name):
             continue
-        friendly_name = str(getattr(instance, "friendly_name", ""))
-        if _extract_template_group(friendly_name) is not None:
-            matches.append(instance)
-
-    if not matches:
-        return None, None
-    matches.sort(key=lambda i: str(getattr(i, "instance_name", "")))
-    selected = matches[0]
-    selected_group = _extract_template_group(str(getattr(selected, "friendly_name", "")))
+        if selected is None or instance_name < selected_name:
+            selected, selected_name, selected_group = instance, instance_name, group
     return selected, selected_group
 
 
@@ -139,14 +292,10 @@ def _iter_settings_from_spec(settings_spec: object) -> list[object]:
 
 
 def _is_game_related_setting(setting: object) -> bool:
-    node = str(getattr(setting, "node", "") or "")
-    node_prefixes = (
-        "GenericModule.",
-        "steamcmdplugin.",
-        "RCONPlugin.",
-        "Meta.GenericModule.",
-    )
-    return node.startswith(node_prefixes)
+    node = getattr(setting, "node", None)
+    if not isinstance(node, str):
+        node = str(node or "")
+    return node.startswith(GAME_NODE_PREFIXES)
 
 
 def _print_controller_status(ctrl_status: object) -> None:
@@ -161,7 +310,11 @@ def _print_controller_status(ctrl_status: object) -> None:
     )
 
 
-def _print_instance_statuses(statuses: object, instances_by_id: dict[str, object]) -> None:
+def _print_instance_statuses(
+    statuses: object,
+    instances_by_id: dict[str, object],
+    friendly_cache: dict[str, tuple[str, str, str | None]],
+) -> None:
     if isinstance(statuses, list) and statuses:
         printed = 0
         print("Instance statuses (non-ADS):")
@@ -175,7 +328,8 @@ def _print_instance_statuses(statuses: object, instances_by_id: dict[str, object
             app_state = getattr(instance, "app_state", "<unknown>")
             if _is_ads_instance(module=module, instance_name=instance_name):
                 continue
-            if _is_template_instance_friendly(friendly_name):
+            friendly_info = friendly_cache.get(instance_id) or _friendly_info(friendly_name)
+            if _is_template_instance_friendly(friendly_info):
                 continue
             printed += 1
             print(
@@ -189,82 +343,86 @@ def _print_instance_statuses(statuses: object, instances_by_id: dict[str, object
         print("No instance status list returned.")
 
 
-async def _print_application_statuses(ads: SafeAMPControllerInstance, statuses: object) -> None:
+async def _print_application_statuses(
+    batcher: AmpBatcher,
+    statuses: object,
+    friendly_cache: dict[str, tuple[str, str, str | None]],
+) -> None:
     print("\nApplication status (running instances):")
     if not isinstance(statuses, list) or not statuses:
         print("- No statuses available to query applications.")
         return
 
-    any_printed = False
-    for entry in statuses:
-        instance_id = getattr(entry, "instance_id", "")
-        running = bool(getattr(entry, "running", False))
-        if not instance_id or not running:
-            continue
-
-        instance_obj = await ads.get_instance(instance_id=instance_id, format_data=True)
+    async def _one(instance_id: str) -> str | None:
+        # Returns the line to print for this instance, or None when it is skipped.
+        instance_obj = await batcher.get_instance(instance_id)
         if isinstance(instance_obj, ActionResultError):
-            print(f"- instance_id={instance_id} error=get_instance failed ({instance_obj})")
-            any_printed = True
-            continue
+            return f"- instance_id={instance_id} error=get_instance failed ({instance_obj})"
 
         friendly_name = getattr(instance_obj, "friendly_name", "<unknown>")
         instance_name = getattr(instance_obj, "instance_name", "<unknown>")
         module = getattr(instance_obj, "module", "<unknown>")
         if _is_ads_instance(module=module, instance_name=instance_name):
-            continue
-        if _is_template_instance_friendly(friendly_name):
-            continue
+            return None
+        friendly_info = friendly_cache.get(instance_id) or _friendly_info(friendly_name)
+        if _is_template_instance_friendly(friendly_info):
+            return None
         app_status = await instance_obj.get_application_status(format_data=True)
         if isinstance(app_status, ActionResultError):
-            print(
+            return (
                 f"- {friendly_name} ({instance_name}) instance_id={instance_id} "
                 f"error=get_application_status failed ({app_status})"
             )
-            any_printed = True
-            continue
 
         metrics = getattr(app_status, "metrics", None)
         active_users = getattr(getattr(metrics, "active_users", None), "raw_value", "<unknown>")
         cpu_percent = getattr(getattr(metrics, "cpu_usage", None), "percent", "<unknown>")
         mem_percent = getattr(getattr(metrics, "memory_usage", None), "percent", "<unknown>")
-        any_printed = True
-        print(
+        return (
             f"- {friendly_name} ({instance_name}) instance_id={instance_id} "
             f"state={getattr(app_status, 'state', '<unknown>')} "
             f"uptime={getattr(app_status, 'uptime', '<unknown>')} "
             f"active_users={active_users} cpu={cpu_percent}% mem={mem_percent}%"
         )
 
+    instance_ids = [
+        instance_id
+        for entry in statuses
+        if (instance_id := getattr(entry, "instance_id", "")) and bool(getattr(entry, "running", False))
+    ]
+    results = await _gather_limited(_one(instance_id) for instance_id in instance_ids)
+
+    any_printed = False
+    for instance_id, line in zip(instance_ids, results):
+        if isinstance(line, BaseException):
+            line = f"- instance_id={instance_id} error=status query failed ({line!r})"
+        if line is None:
+            continue
+        any_printed = True
+        print(line)
+
     if not any_printed:
         print("- No running non-ADS instances.")
 
 
 async def _print_template_game_settings(
-    ads: SafeAMPControllerInstance,
-    instances_by_id: dict[str, object],
+    batcher: AmpBatcher,
+    instances_by_name: dict[str, object],
     template_instance_name: str,
 ) -> None:
     print(f"\nTemplate game settings ({template_instance_name}):")
-    template_meta = next(
-        (
-            instance
-            for instance in instances_by_id.values()
-            if getattr(instance, "instance_name", "") == template_instance_name
-        ),
-        None,
-    )
+    template_meta = instances_by_name.get(template_instance_name)
     if template_meta is None:
         print("- Template instance not found.")
         return
 
     template_id = getattr(template_meta, "instance_id", "")
-    template_obj = await ads.get_instance(instance_id=template_id, format_data=True)
+    template_obj = await batcher.get_instance(template_id)
     if isinstance(template_obj, ActionResultError):
         print(f"- Failed to load template instance: {template_obj}")
         return
 
-    settings_spec = await template_obj.get_setting_spec(format_data=True)
+    settings_spec = await batcher.get_setting_spec(template_obj, format_data=True)
     if isinstance(settings_spec, ActionResultError):
         print(f"- Failed to query setting spec: {settings_spec}")
         return
@@ -286,47 +444,38 @@ async def _print_template_game_settings(
 
 
 def _arksa_bucket_from_subcategory(subcategory: str) -> str:
-    lower = subcategory.lower()
-    if lower.startswith("server:"):
-        return "Server"
-    if lower.startswith("gameplay:"):
-        return "Gameplay"
-    if lower.startswith("multipliers:"):
-        return "Multipliers"
-    if lower.startswith("structures:"):
-        return "Structures"
-    if lower.startswith("clusters:"):
-        return "Clusters"
-    return "Overall"
+    head, sep, _ = subcategory.partition(":")
+    if not sep:
+        return "Overall"
+    return ARKSA_SUBCATEGORY_BUCKETS.get(head.lower(), "Overall")
 
 
+@_flush_log_after
 async def _print_arksa_menu_configuration_settings(
-    ads: SafeAMPControllerInstance,
     template_meta: object,
+    template_obj: object | None,
+    settings_spec: object | None,
 ) -> None:
     template_instance_name = str(getattr(template_meta, "instance_name", "<unknown>"))
-    print(f"\nTemplate menu configuration ({template_instance_name}):")
+    _log(f"\nTemplate menu configuration ({template_instance_name}):")
     if not bool(getattr(template_meta, "running", False)):
-        print("- Template instance unavailable/offline; menu settings not queried.")
+        _log("- Template instance unavailable/offline; menu settings not queried.")
         return
 
-    template_id = getattr(template_meta, "instance_id", "")
-    template_obj = await ads.get_instance(instance_id=template_id, format_data=True)
     if isinstance(template_obj, ActionResultError):
-        print(f"- Failed to load template instance: {template_obj}")
+        _log(f"- Failed to load template instance: {template_obj}")
         return
 
-    settings_spec = await template_obj.get_setting_spec(format_data=False)
     if isinstance(settings_spec, ActionResultError):
-        print(f"- Failed to query setting spec: {settings_spec}")
+        _log(f"- Failed to query setting spec: {settings_spec}")
         return
     if not isinstance(settings_spec, dict):
-        print("- Unexpected setting spec format.")
+        _log("- Unexpected setting spec format.")
         return
 
     arksa_settings = settings_spec.get("arksa:stadiacontroller", [])
     if not isinstance(arksa_settings, list) or not arksa_settings:
-        print("- No template menu settings returned.")
+        _log("- No template menu settings returned.")
         return
 
     buckets: dict[str, list[dict]] = {
@@ -337,9 +486,15 @@ async def _print_arksa_menu_configuration_settings(
         "Clusters": [],
         "Overall": [],
     }
-    for item in arksa_settings:
-        if not isinstance(item, dict):
-            continue
+    # Sort once up front; bucket lists keep that order since appends are stable.
+    # Keys are built in the filtering pass so the sort itself runs without a Python callback.
+    decorated = [
+        ((int(item.get("order", 0)), str(item.get("node", ""))), item)
+        for item in arksa_settings
+        if isinstance(item, dict)
+    ]
+    decorated.sort(key=itemgetter(0))
+    for _, item in decorated:
         bucket = _arksa_bucket_from_subcategory(str(item.get("subcategory", "")))
         buckets[bucket].append(item)
 
@@ -347,9 +502,9 @@ async def _print_arksa_menu_configuration_settings(
         items = buckets[section]
         if not items:
             continue
-        print(f"\n[{section}] ({len(items)})")
-        for setting in sorted(items, key=lambda x: (int(x.get("order", 0)), str(x.get("node", "")))):
-            print(
+        _log(f"\n[{section}] ({len(items)})")
+        for setting in items:
+            _log(
                 f"- {setting.get('name', '<unknown>')} | "
                 f"node={setting.get('node', '<unknown>')} | "
                 f"value={setting.get('current_value', '<unknown>')} | "
@@ -357,37 +512,42 @@ async def _print_arksa_menu_configuration_settings(
             )
 
 
+@_flush_log_after
 async def _discover_arksa_instances(
-    ads: SafeAMPControllerInstance,
+    batcher: AmpBatcher,
     instances_by_id: dict[str, object],
+    friendly_cache: dict[str, tuple[str, str, str | None]],
     template_group: str,
     include_instance_name: str | None = None,
 ) -> dict[str, object]:
-    print("\nDiscovering destination instances (group marker check):")
-    arksa: dict[str, object] = {}
-    for instance in instances_by_id.values():
+    _log("\nDiscovering destination instances (group marker check):")
+    candidates: list[tuple[str, object, bool]] = []
+    for instance_id, instance in instances_by_id.items():
         instance_name = getattr(instance, "instance_name", "<unknown>")
-        friendly_name = str(getattr(instance, "friendly_name", ""))
+        friendly_lower = friendly_cache[instance_id][1]
         module = getattr(instance, "module", "<unknown>")
         is_included_source = include_instance_name is not None and str(instance_name) == include_instance_name
         if _is_ads_instance(module=module, instance_name=instance_name):
             continue
-        if not is_included_source and not _has_destination_group(friendly_name=friendly_name, group=template_group):
-            print(f"- skip {instance_name}: missing destination marker -{template_group}-")
+        if not is_included_source and not _has_destination_group(friendly_lower=friendly_lower, group=template_group):
+            _log(f"- skip {instance_name}: missing destination marker -{template_group}-")
             continue
         if not is_included_source and not bool(getattr(instance, "running", False)):
-            print(f"- skip {instance_name}: instance unavailable/offline")
+            _log(f"- skip {instance_name}: instance unavailable/offline")
             continue
-        instance_id = getattr(instance, "instance_id", "")
-        instance_obj = await ads.get_instance(instance_id=instance_id, format_data=True)
-        if isinstance(instance_obj, ActionResultError):
-            print(f"- skip {instance_name}: get_instance failed")
+        candidates.append((instance_id, instance_name, is_included_source))
+
+    resolved = await _gather_limited(batcher.get_instance(instance_id) for instance_id, _, _ in candidates)
+    arksa: dict[str, object] = {}
+    for (instance_id, instance_name, is_included_source), instance_obj in zip(candidates, resolved):
+        if isinstance(instance_obj, (ActionResultError, BaseException)):
+            _log(f"- skip {instance_name}: get_instance failed")
             continue
         arksa[instance_id] = instance_obj
         if is_included_source:
-            print(f"- source template included: {getattr(instance_obj, 'friendly_name', instance_name)} ({instance_name})")
+            _log(f"- source template included: {getattr(instance_obj, 'friendly_name', instance_name)} ({instance_name})")
         else:
-            print(f"- destination confirmed: {getattr(instance_obj, 'friendly_name', instance_name)} ({instance_name})")
+            _log(f"- destination confirmed: {getattr(instance_obj, 'friendly_name', instance_name)} ({instance_name})")
     return arksa
 
 
@@ -409,7 +569,7 @@ def _build_master_arksa_value_map(arksa_settings: list[dict]) -> dict[str, str]:
         elif isinstance(raw, (int, float, str)):
             values[node] = str(raw)
         else:
-            values[node] = json.dumps(raw, separators=(",", ":"))
+            values[node] = _json_dumps_compact(raw)
     return values
 
 
@@ -471,20 +631,14 @@ def _build_master_value_map(group_items: list[dict], skip_nodes: set[str] | None
 
 
 def _build_writable_node_current_values(settings_spec: dict) -> dict[str, str]:
-    values: dict[str, str] = {}
-    for group_items in settings_spec.values():
-        if not isinstance(group_items, list):
-            continue
-        for item in group_items:
-            if not isinstance(item, dict):
-                continue
-            node = str(item.get("node", "")).strip()
-            if not node:
-                continue
-            if bool(item.get("read_only", False)):
-                continue
-            values[node] = str(item.get("current_value", ""))
-    return values
+    items = chain.from_iterable(group for group in settings_spec.values() if isinstance(group, list))
+    return {
+        node: str(item.get("current_value", ""))
+        for item in items
+        if isinstance(item, dict)
+        for node in (str(item.get("node", "")).strip(),)
+        if node and not item.get("read_only", False)
+    }
 
 
 def _should_skip_node(node: str) -> bool:
@@ -508,6 +662,8 @@ def _normalize_value(value: object) -> str:
     if text.startswith("[") and text.endswith("]"):
         candidate = text.replace("'", "\"")
         try:
+            # Stdlib parser on purpose: orjson turns >64-bit ints into floats and rejects NaN,
+            # which would change which settings count as aligned.
             parsed = json.loads(candidate)
             if isinstance(parsed, list):
                 return json.dumps(parsed, separators=(",", ":"), ensure_ascii=False)
@@ -527,21 +683,25 @@ def _application_type(instance_obj: object) -> str:
     return str(getattr(instance_obj, "module", "")).strip()
 
 
-async def _wait_for_application_stop(target: object, timeout_seconds: int = 60, interval_seconds: int = 1) -> bool:
-    elapsed = 0
-    while elapsed <= timeout_seconds:
+async def _wait_for_application_stop(
+    target: object,
+    timeout_seconds: float = 60,
+    initial_delay: float = 0.1,
+    max_delay: float = 1.0,
+) -> bool:
+    # Poll with exponential backoff so fast stops are seen quickly; slow stops settle at max_delay.
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    delay = initial_delay
+    while True:
         refreshed = await target.get_instance_status()
-        if isinstance(refreshed, ActionResultError):
-            await asyncio.sleep(interval_seconds)
-            elapsed += interval_seconds
-            continue
-
-        if not bool(getattr(refreshed, "running", True)):
+        if not isinstance(refreshed, ActionResultError) and not bool(getattr(refreshed, "running", True)):
             return True
-
-        await asyncio.sleep(interval_seconds)
-        elapsed += interval_seconds
-    return False
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
 
 
 def _state_text(status: object) -> str:
@@ -579,7 +739,12 @@ async def _wait_for_application_running(target: object, timeout_seconds: int = 1
     return False
 
 
-async def _stop_then_start_instance(target: object, friendly: str, name: str) -> bool:
+async def _stop_then_start_instance(
+    target: object,
+    friendly: str,
+    name: str,
+    log: Callable[[str], None] = print,
+) -> bool:
     is_running: bool | None = None
     app_status = None
     try:
@@ -594,9 +759,9 @@ async def _stop_then_start_instance(target: object, friendly: str, name: str) ->
         elif "ready" in app_state or "starting" in app_state or "restarting" in app_state:
             is_running = True
         elif "stopping" in app_state:
-            print(f"- {friendly} ({name}): app is stopping, waiting for stop before start")
+            log(f"- {friendly} ({name}): app is stopping, waiting for stop before start")
             if not await _wait_for_application_stop(target=target):
-                print(f"- {friendly} ({name}): timed out waiting for app to stop")
+                log(f"- {friendly} ({name}): timed out waiting for app to stop")
                 return False
             is_running = False
         else:
@@ -605,76 +770,81 @@ async def _stop_then_start_instance(target: object, friendly: str, name: str) ->
     if is_running is None:
         status = await target.get_instance_status()
         if isinstance(status, ActionResultError):
-            print(f"- {friendly} ({name}): could not determine status before stop/start")
+            log(f"- {friendly} ({name}): could not determine status before stop/start")
             return False
         if _is_transition_state(_state_text(status)):
-            print(f"- {friendly} ({name}): waiting for existing transition to settle")
+            log(f"- {friendly} ({name}): waiting for existing transition to settle")
             if not await _wait_until_not_transitioning(target=target):
-                print(f"- {friendly} ({name}): timed out waiting for transition to settle")
+                log(f"- {friendly} ({name}): timed out waiting for transition to settle")
                 return False
             status = await target.get_instance_status()
             if isinstance(status, ActionResultError):
-                print(f"- {friendly} ({name}): could not determine status after waiting")
+                log(f"- {friendly} ({name}): could not determine status after waiting")
                 return False
         is_running = bool(getattr(status, "running", False))
 
     if is_running:
         stop_res = await target.stop_application()
         if isinstance(stop_res, ActionResultError):
-            print(f"- {friendly} ({name}): stop failed: {stop_res}")
+            log(f"- {friendly} ({name}): stop failed: {stop_res}")
             return False
-        print(f"- {friendly} ({name}): stop requested")
+        log(f"- {friendly} ({name}): stop requested")
         if not await _wait_for_application_stop(target=target):
-            print(f"- {friendly} ({name}): timed out waiting for app to stop")
+            log(f"- {friendly} ({name}): timed out waiting for app to stop")
             return False
-        print(f"- {friendly} ({name}): stop confirmed")
+        log(f"- {friendly} ({name}): stop confirmed")
 
     start_res = await target.start_application(format_data=False)
     if isinstance(start_res, ActionResultError):
-        print(f"- {friendly} ({name}): start failed: {start_res}")
+        log(f"- {friendly} ({name}): start failed: {start_res}")
         return False
-    print(f"- {friendly} ({name}): start requested")
+    log(f"- {friendly} ({name}): start requested")
     if not await _wait_for_application_running(target=target):
-        print(f"- {friendly} ({name}): timed out waiting for app to start")
+        log(f"- {friendly} ({name}): timed out waiting for app to start")
         return False
-    print(f"- {friendly} ({name}): start confirmed")
+    log(f"- {friendly} ({name}): start confirmed")
     return True
 
 
+@_flush_log_after
 async def _sync_arksa_settings_from_master(
-    ads: SafeAMPControllerInstance,
+    batcher: AmpBatcher,
     instances_by_id: dict[str, object],
+    friendly_cache: dict[str, tuple[str, str, str | None]],
     master_instance_name: str,
+    master_spec: object | None,
     template_group: str,
     dry_run: bool,
+    batch_size: int = 0,
 ) -> None:
     mode = "DRY RUN" if dry_run else "APPLY"
-    print(f"\nSync game settings from template: {master_instance_name} ({mode})")
+    _log(f"\nSync game settings from template: {master_instance_name} ({mode})")
     arksa_instances = await _discover_arksa_instances(
-        ads=ads,
+        batcher=batcher,
         instances_by_id=instances_by_id,
+        friendly_cache=friendly_cache,
         template_group=template_group,
         include_instance_name=master_instance_name,
     )
     if not arksa_instances:
-        print("- No destination instances discovered. Sync skipped.")
+        _log("- No destination instances discovered. Sync skipped.")
         return
 
-    master = next(
-        (inst for inst in arksa_instances.values() if getattr(inst, "instance_name", "") == master_instance_name),
-        None,
-    )
+    # Name index for the master lookup only; setdefault keeps the first instance per name, as the scan did.
+    arksa_instances_by_name: dict[str, object] = {}
+    for inst in arksa_instances.values():
+        arksa_instances_by_name.setdefault(str(getattr(inst, "instance_name", "")), inst)
+    master = arksa_instances_by_name.get(master_instance_name)
     if master is None:
-        print("- Template instance not found in destination set. Sync skipped.")
+        _log("- Template instance not found in destination set. Sync skipped.")
         return
 
-    master_spec = await master.get_setting_spec(format_data=False)
     if isinstance(master_spec, ActionResultError) or not isinstance(master_spec, dict):
-        print("- Failed to load master setting spec. Sync skipped.")
+        _log("- Failed to load master setting spec. Sync skipped.")
         return
     master_arksa_settings = master_spec.get(ARKSA_GROUP_KEY, [])
     if not isinstance(master_arksa_settings, list) or not master_arksa_settings:
-        print("- Template settings group missing. Sync skipped.")
+        _log("- Template settings group missing. Sync skipped.")
         return
 
     master_game_values = _build_master_arksa_value_map(master_arksa_settings)
@@ -687,23 +857,24 @@ async def _sync_arksa_settings_from_master(
         backup_values.update(_build_master_value_map(group_items))
     master_values = dict(master_game_values)
     master_values.update(backup_values)
-    master_game_nodes = set(master_game_values.keys()) | {
-        node for node in ARKSA_FORCED_NODE_VALUES.keys() if node in master_values or node == "GenericModule.App.UseRandomAdminPassword"
-    }
+    master_game_nodes = set(master_game_values.keys()) | set(ARKSA_FORCED_NODE_VALUES.keys())
+    # Forced values override the template and the merged map is sorted by node once, so every
+    # per-target payload filtered from it is already in print order.
+    payload_candidates = dict(sorted({**master_values, **ARKSA_FORCED_NODE_VALUES}.items()))
 
-    print(f"- Master settings candidates: {len(master_values)}")
-    print(f"- Explicitly skipped nodes: {len(ARKSA_SKIP_NODES)}")
+    _log(f"- Master settings candidates: {len(master_values)}")
+    _log(f"- Explicitly skipped nodes: {len(ARKSA_SKIP_NODES)}")
     if backup_group_keys:
-        print(f"- Backup settings groups included: {', '.join(sorted(backup_group_keys))}")
-        print(f"- Backup settings candidates: {len(backup_values)}")
+        _log(f"- Backup settings groups included: {', '.join(sorted(backup_group_keys))}")
+        _log(f"- Backup settings candidates: {len(backup_values)}")
     else:
-        print("- Backup settings groups included: none detected")
+        _log("- Backup settings groups included: none detected")
 
     targets = [inst for inst in arksa_instances.values() if getattr(inst, "instance_name", "") != master_instance_name]
     if not targets:
-        print("- No target destination instances (only template exists).")
+        _log("- No target destination instances (only template exists).")
         return
-    print(f"- Target destination instances: {len(targets)}")
+    _log(f"- Target destination instances: {len(targets)}")
 
     template_app_type = _application_type(master)
     mismatches: list[str] = []
@@ -716,18 +887,20 @@ async def _sync_arksa_settings_from_master(
                 f"template_type={template_app_type} target_type={target_type}"
             )
     if mismatches:
-        print("\nApplication type mismatch detected. Halting sync.")
+        _log("\nApplication type mismatch detected. Halting sync.")
         for line in mismatches:
-            print(line)
+            _log(line)
         return
 
+    # Normalize template-side values once rather than once per target.
+    payload_candidates_norm = {node: _normalize_value(value) for node, value in payload_candidates.items()}
+    target_specs = await _gather_limited(batcher.get_setting_spec(target) for target in targets)
     target_reports: list[dict[str, object]] = []
-    for target in targets:
+    for target, target_spec in zip(targets, target_specs):
         target_name = getattr(target, "instance_name", "<unknown>")
         target_friendly = getattr(target, "friendly_name", target_name)
 
-        target_spec = await target.get_setting_spec(format_data=False)
-        if isinstance(target_spec, ActionResultError) or not isinstance(target_spec, dict):
+        if not isinstance(target_spec, dict):
             target_reports.append(
                 {
                     "target": target,
@@ -757,24 +930,15 @@ async def _sync_arksa_settings_from_master(
         target_allowed_nodes = set(target_current_values.keys())
         payload_all = {
             node: value
-            for node, value in master_values.items()
-            if node in target_allowed_nodes and not _should_skip_node(node)
-        }
-        for forced_node, forced_value in ARKSA_FORCED_NODE_VALUES.items():
-            if forced_node in target_allowed_nodes:
-                payload_all[forced_node] = forced_value
-                master_game_nodes.add(forced_node)
-
-        payload_diff = {
-            node: new_value
-            for node, new_value in payload_all.items()
-            if _normalize_value(target_current_values.get(node, "")) != _normalize_value(new_value)
-        }
-        payload_same = {
-            node: value
-            for node, value in payload_all.items()
-            if _normalize_value(target_current_values.get(node, "")) == _normalize_value(value)
+            for node, value in payload_candidates.items()
+            if node in target_allowed_nodes and (node in ARKSA_FORCED_NODE_VALUES or not _should_skip_node(node))
         }
+
+        payload_diff: dict[str, str] = {}
+        payload_same: dict[str, str] = {}
+        for node, new_value in payload_all.items():
+            current_norm = _normalize_value(target_current_values.get(node, ""))
+            (payload_diff if current_norm != payload_candidates_norm[node] else payload_same)[node] = new_value
         game_diff = {node: value for node, value in payload_diff.items() if node in master_game_nodes}
         backup_diff = {node: value for node, value in payload_diff.items() if node not in master_game_nodes}
         target_reports.append(
@@ -792,28 +956,28 @@ async def _sync_arksa_settings_from_master(
             }
         )
 
-    print("\nNo Update Needed By Server:")
+    _log("\nNo Update Needed By Server:")
     for report in target_reports:
         name = str(report["name"])
         friendly = str(report["friendly"])
         same = report["same"]
         error = report["error"]
         if error is not None:
-            print(f"- {friendly} ({name}): unable to evaluate ({error})")
+            _log(f"- {friendly} ({name}): unable to evaluate ({error})")
             continue
         assert isinstance(same, dict)
-        print(f"- {friendly} ({name}): {len(same)} setting(s) already aligned")
-        for node in sorted(same.keys()):
-            print(f"  - {node}: {same[node]}")
+        _log(f"- {friendly} ({name}): {len(same)} setting(s) already aligned")
+        for node in same:
+            _log(f"  - {node}: {same[node]}")
 
-    print("\nUpdate Required By Server:")
+    _log("\nUpdate Required By Server:")
     for report in target_reports:
         name = str(report["name"])
         friendly = str(report["friendly"])
         diff = report["diff"]
         error = report["error"]
         if error is not None:
-            print(f"- {friendly} ({name}): unable to evaluate ({error})")
+            _log(f"- {friendly} ({name}): unable to evaluate ({error})")
             continue
         assert isinstance(diff, dict)
         game_diff = report.get("game_diff", {})
@@ -821,53 +985,97 @@ async def _sync_arksa_settings_from_master(
         game_count = len(game_diff) if isinstance(game_diff, dict) else 0
         backup_count = len(backup_diff) if isinstance(backup_diff, dict) else 0
         restart_required = bool(report.get("restart_required", False))
-        print(
+        _log(
             f"- {friendly} ({name}): {len(diff)} setting(s) need update "
             f"(game={game_count}, backup={backup_count}, restart={'yes' if restart_required else 'no'})"
         )
         current = report.get("current", {})
         if not isinstance(current, dict):
             current = {}
-        for node in sorted(diff.keys()):
+        for node in diff:
             old_value = current.get(node, "<unset>")
-            print(f"  - {node}: {old_value} -> {diff[node]}")
+            _log(f"  - {node}: {old_value} -> {diff[node]}")
 
     if dry_run:
-        print("- dry run only: no stop/apply/start executed")
+        _log("- dry run only: no stop/apply/start executed")
         return
 
-    for report in target_reports:
-        error = report["error"]
-        if error is not None:
-            continue
-        diff = report["diff"]
-        if not isinstance(diff, dict) or not diff:
-            continue
-        target = report["target"]
-        name = str(report["name"])
-        friendly = str(report["friendly"])
-        print(f"\nApplying changes: {friendly} ({name})")
-
+    # Targets are independent, so each one's apply + restart pipeline runs concurrently.
+    # Output is buffered per target and printed in report order once all are done.
+    apply_reports = [
+        report
+        for report in target_reports
+        if report["error"] is None and isinstance(report["diff"], dict) and report["diff"]
+    ]
+    _flush_log()
+    results = await _gather_limited(
+        _apply_target_report(report, batch_size=batch_size) for report in apply_reports
+    )
+    for report, lines in zip(apply_reports, results):
+        if isinstance(lines, BaseException):
+            lines = [
+                f"\nApplying changes: {report['friendly']} ({report['name']})",
+                f"- apply failed: {lines!r}",
+            ]
+        _log("\n".join(lines))
+
+
+async def _apply_diff_batched(
+    target: object,
+    diff: dict[str, str],
+    max_batch: int = 64,
+    target_latency: float = 2.0,
+    smoothing: float = 0.3,
+) -> tuple[int, ActionResultError | None]:
+    # Send the diff in sequential set_configs chunks, resizing them toward target_latency seconds
+    # per call: halve while the smoothed latency is over target, grow back up to max_batch once
+    # it is well under. Stops at the first failed chunk; returns (applied count, error or None).
+    loop = asyncio.get_running_loop()
+    items = list(diff.items())
+    batch = max(1, max_batch)
+    ewma: float | None = None
+    applied = 0
+    while applied < len(items):
+        chunk = dict(items[applied : applied + batch])
+        started = loop.time()
+        result = await target.set_configs(data=chunk, format_data=False)
+        if isinstance(result, ActionResultError):
+            return applied, result
+        applied += len(chunk)
+        elapsed = loop.time() - started
+        ewma = elapsed if ewma is None else smoothing * elapsed + (1 - smoothing) * ewma
+        if ewma > target_latency:
+            batch = max(1, batch // 2)
+        elif ewma < target_latency / 2:
+            batch = min(max_batch, batch * 2)
+    return applied, None
+
+
+async def _apply_target_report(report: dict[str, object], batch_size: int = 0) -> list[str]:
+    target = report["target"]
+    diff = report["diff"]
+    name = str(report["name"])
+    friendly = str(report["friendly"])
+    lines: list[str] = [f"\nApplying changes: {friendly} ({name})"]
+    log = lines.append
+
+    if batch_size > 0:
+        applied, apply_res = await _apply_diff_batched(target=target, diff=diff, max_batch=batch_size)
+        if apply_res is not None:
+            log(f"- set_configs failed after {applied}/{len(diff)} setting(s): {apply_res}")
+            return lines
+    else:
         apply_res = await target.set_configs(data=diff, format_data=False)
         if isinstance(apply_res, ActionResultError):
-            print(f"- set_configs failed: {apply_res}")
-            continue
-        print(f"- updated settings count: {len(diff)}")
+            log(f"- set_configs failed: {apply_res}")
+            return lines
+    log(f"- updated settings count: {len(diff)}")
 
-    print("\nTarget server lifecycle:")
-    for report in target_reports:
-        if report["error"] is not None:
-            continue
-        diff = report["diff"]
-        if not isinstance(diff, dict) or not diff:
-            continue
-        target = report["target"]
-        name = str(report["name"])
-        friendly = str(report["friendly"])
-        if not bool(report.get("restart_required", False)):
-            print(f"- {friendly} ({name}): restart skipped (backup-only changes or no game-setting changes)")
-            continue
-        await _stop_then_start_instance(target=target, friendly=friendly, name=name)
+    if not bool(report.get("restart_required", False)):
+        log(f"- {friendly} ({name}): restart skipped (backup-only changes or no game-setting changes)")
+        return lines
+    await _stop_then_start_instance(target=target, friendly=friendly, name=name, log=log)
+    return lines
 
 
 def _parse_args() -> argparse.Namespace:
@@ -877,6 +1085,12 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Show what settings would change on destination targets without stopping or updating instances.",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="Apply settings in chunks of at most this many nodes, adapting to AMP latency (default: 0, one call per server).",
+    )
     return parser.parse_args()
 
 
@@ -890,7 +1104,7 @@ async def main() -> int:
     params = APIParams(url=amp_url, user=amp_user, password=amp_pass)
     Bridge(api_params=params)
 
-    ads = SafeAMPControllerInstance()
+    ads = SafeAMPControllerInstance(session=_build_http_session())
 
     logged_in = False
     try:
@@ -908,9 +1122,13 @@ async def main() -> int:
             print(f"Instance list query failed: {instances}")
             return 4
         instances_by_id: dict[str, object] = {
-            getattr(instance, "instance_id", ""): instance for instance in instances if getattr(instance, "instance_id", "")
+            instance_id: instance for instance in instances if (instance_id := getattr(instance, "instance_id", ""))
         }
-        master_template, template_group = _find_master_template_instance(instances_by_id=instances_by_id)
+        friendly_cache = _build_friendly_cache(instances_by_id)
+        master_template, template_group = _find_master_template_instance(
+            instances_by_id=instances_by_id,
+            friendly_cache=friendly_cache,
+        )
         if master_template is None:
             print("\nMaster template not found. Friendly name must match pattern '-TEMPLATE <GROUP>-'.")
             return 5
@@ -929,24 +1147,36 @@ async def main() -> int:
             print(f"Instance status query failed: {statuses}")
             return 3
 
-        _print_instance_statuses(statuses, instances_by_id)
-        await _print_application_statuses(ads, statuses)
+        batcher = AmpBatcher(ads)
+        _print_instance_statuses(statuses, instances_by_id, friendly_cache)
+        await _print_application_statuses(batcher, statuses, friendly_cache)
         # Old generic template settings output intentionally disabled for now.
         # await _print_template_game_settings(
-        #     ads=ads,
-        #     instances_by_id=instances_by_id,
+        #     batcher=batcher,
+        #     instances_by_name={str(getattr(i, "instance_name", "")): i for i in instances_by_id.values()},
         #     template_instance_name="ARKSurvivalAscended02",
         # )
+        # Fetch the template instance and its setting spec once; the menu printout and the sync share them.
+        master_obj: object | None = None
+        master_spec: object | None = None
+        if bool(getattr(master_template, "running", False)):
+            master_obj = await batcher.get_instance(getattr(master_template, "instance_id", ""))
+            if not isinstance(master_obj, ActionResultError):
+                master_spec = await batcher.get_setting_spec(master_obj)
         await _print_arksa_menu_configuration_settings(
-            ads=ads,
             template_meta=master_template,
+            template_obj=master_obj,
+            settings_spec=master_spec,
         )
         await _sync_arksa_settings_from_master(
-            ads=ads,
+            batcher=batcher,
             instances_by_id=instances_by_id,
+            friendly_cache=friendly_cache,
             master_instance_name=str(getattr(master_template, "instance_name", "")),
+            master_spec=master_spec,
             template_group=template_group,
             dry_run=args.dry_run,
+            batch_size=args.batch_size,
         )
         return 0
     finally: